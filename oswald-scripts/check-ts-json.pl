@@ -12,10 +12,16 @@ use strict;
 use POSIX 'strftime';
 use JSON::PP;
 use File::Basename;
+use Time::HiRes ();
 
 # Try XML::LibXML, fall back to regex parsing
 my $HAS_LIBXML = eval { require XML::LibXML; 1 };
 
+# Prefer an XS JSON encoder, fall back to JSON::PP
+my $JSON_CLASS = eval { require Cpanel::JSON::XS; 'Cpanel::JSON::XS' }
+              // eval { require JSON::XS; 'JSON::XS' }
+              // 'JSON::PP';
+
 # Parse a .ts file and return ($translated_count, $total_count)
 sub parse_ts_file {
     my ($file) = @_;
@@ -31,9 +37,8 @@ sub _parse_ts_libxml {
     my $doc = XML::LibXML->load_xml(location => $file);
     my $total = 0;
     my $translated = 0;
-    for my $msg ($doc->findnodes('//message')) {
-        my ($tr) = $msg->findnodes('translation');
-        next unless $tr;
+    # Select the translations directly instead of querying each message again
+    for my $tr ($doc->findnodes('//message/translation')) {
         my $type = $tr->getAttribute('type') // '';
         next if $type eq 'obsolete' || $type eq 'vanished';
         $total++;
@@ -45,30 +50,28 @@ sub _parse_ts_libxml {
 sub _parse_ts_regex {
     my ($file) = @_;
     open my $fh, '<', $file or return (0, 0);
-    my $content = do { local $/; <$fh> };
-    close $fh;
     my $total = 0;
     my $translated = 0;
-    # Match each <message>...</message> block
-    while ($content =~ /<message[^>]*>(.*?)<\/message>/gs) {
+    # Read one <message>...</message> block at a time rather than
+    # slurping the whole catalog
+    local $/ = '</message>';
+    while (my $record = <$fh>) {
+        next unless $record =~ /<message[^>]*>(.*?)<\/message>/s;
         my $block = $1;
-        if ($block =~ /<translation\s+type="(obsolete|vanished)"/) {
-            next;
-        }
+        # One scan per block: the type attribute decides the bucket
+        my $type = $block =~ /<translation\s+type="(obsolete|vanished|unfinished)"/ ? $1 : '';
+        next if $type eq 'obsolete' || $type eq 'vanished';
         $total++;
-        if ($block =~ /<translation\s+type="unfinished"/) {
-            # not translated
-        } else {
-            $translated++;
-        }
+        $translated++ unless $type eq 'unfinished';
     }
+    close $fh;
     return ($translated, $total);
 }
 
 # Get percentage string for a .ts file
 sub ts_percentage {
     my ($file) = @_;
-    my ($translated, $total) = parse_ts_file($file);
+    my ($translated, $total) = parse_ts_file_cached($file);
     return "n/a" if $total == 0;
     return int($translated * 100 / $total);
 }
@@ -101,6 +104,34 @@ if (-f $branch_map_file) {
     }
 }
 
+# Parse results from earlier runs, keyed by path and reused while the
+# parser and the file's mtime and size are unchanged
+my $ts_cache_file = "$script_dir/ts-cache.json";
+# Bump the version suffix whenever either parser's counting changes
+my $ts_parser = ($HAS_LIBXML ? 'xml' : 're') . '.1';
+my %ts_cache;
+if (-f $ts_cache_file) {
+    open my $fh, '<', $ts_cache_file or warn "Cannot open $ts_cache_file: $!";
+    if ($fh) {
+        my $cached = eval { $JSON_CLASS->new->utf8->decode(do { local $/; <$fh> }) };
+        %ts_cache = %{$cached} if ref $cached eq 'HASH';
+        close $fh;
+    }
+}
+
+sub parse_ts_file_cached {
+    my ($file) = @_;
+    my ($size, $mtime) = (Time::HiRes::stat($file))[7, 9];
+    return parse_ts_file($file) unless defined $mtime;
+    my $stamp = "$ts_parser:$mtime:$size";
+    my $entry = $ts_cache{$file};
+    unless ($entry && $entry->[0] eq $stamp) {
+        $entry = [$stamp, parse_ts_file($file)];
+        $ts_cache{$file} = $entry;
+    }
+    return @{$entry}[1, 2];
+}
+
 my %result_data;       # version_id => { lang => { module => pct } }
 my %result_templates;  # version_id => { module => template_path }
 my %result_files;      # version_id => { lang => { module => file_path } }
@@ -112,12 +143,14 @@ sub processQt {
     my %scores;
     my %langs;
     my %file_paths;
+    my @group_res = map { [$_, qr/^${_}_((?:.._)?..)$/] } @{$groups};
 
     my $trans_dir = "$subdir$infix/translations";
     for my $file (glob("$trans_dir/*_??.ts")) {
         my $bn = basename($file, ".ts");
-        for my $g (@{$groups}) {
-            if ($bn =~ /^${g}_((.._)?..)$/) {
+        for my $gr (@group_res) {
+            my ($g, $re) = @{$gr};
+            if ($bn =~ $re) {
                 my $lang = $1;
                 my $pc = ts_percentage($file);
                 $scores{$g}{$lang} = $pc;
@@ -186,11 +219,18 @@ sub doOtherJson {
 
     my %scores;
     my %file_paths;
+    my $file_re = qr/^${filename}_((?:.._)?..)\.ts$/;
     my $trans_dir = "$subdir/$dirname";
-    for my $file (glob("$trans_dir/${filename}_??.ts"), glob("$trans_dir/${filename}_??_??.ts")) {
-        if (basename($file) =~ /^${filename}_(.+)\.ts$/) {
+    # One directory read covers both the xx and xx_YY name patterns
+    my @entries;
+    if (opendir(my $dh, $trans_dir)) {
+        @entries = readdir($dh);
+        closedir($dh);
+    }
+    for my $entry (@entries) {
+        if ($entry =~ $file_re) {
             my $lang = $1;
-            next if $lang eq 'untranslated';
+            my $file = "$trans_dir/$entry";
             $scores{$lang} = ts_percentage($file);
             $file_paths{$lang} = $file;
         }
@@ -231,21 +271,31 @@ sub doOtherJson {
 sub doCreatorJson { doOtherJson("share/qtcreator/translations", "qtcreator", "Qt Creator", "creator", @_); }
 sub doIfwJson     { doOtherJson("src/sdk/translations", "ifw", "Qt Installer Framework", "ifw", @_); }
 
-# Process all arguments
+# Validate all arguments before parsing any catalogs, so a bad entity
+# fails fast instead of after the earlier ones have been processed
+my @jobs;
 for my $ent (@ARGV) {
     $ent =~ /^([\w-]+):([\w.]+):(\w+)$/ or die("Malformed entity '$ent'.\n");
     my ($subdir, $version, $state) = ($1, $2, $3);
+    my $handler;
     if ($subdir =~ /^qt-/) {
-        if ($version =~ /^5/) { doQt5json($subdir, $version, $state); }
-        elsif ($version =~ /^6/) { doQt6json($subdir, $version, $state); }
+        if ($version =~ /^5/) { $handler = \&doQt5json; }
+        elsif ($version =~ /^6/) { $handler = \&doQt6json; }
         else { die("Unsupported Qt version in '$ent'."); }
     } elsif ($subdir =~ /^creator-/) {
-        doCreatorJson($subdir, $version, $state);
+        $handler = \&doCreatorJson;
     } elsif ($subdir =~ /^ifw-/) {
-        doIfwJson($subdir, $version, $state);
+        $handler = \&doIfwJson;
     } else {
         die("Unsupported product in '$ent'.");
     }
+    push @jobs, [$handler, $subdir, $version, $state];
+}
+
+# Process all arguments
+for my $job (@jobs) {
+    my ($handler, @args) = @{$job};
+    $handler->(@args);
 }
 
 # Build output
@@ -261,5 +311,19 @@ if (%branch_map) {
     $output{branchMap} = \%branch_map;
 }
 
-my $json = JSON::PP->new->utf8->canonical->pretty->encode(\%output);
-print $json;
+my $json = $JSON_CLASS->new->utf8->canonical->encode(\%output);
+print $json, "\n";
+
+# Save the parse cache. Entries for versions not passed this run are kept;
+# only files that no longer exist are dropped.
+for my $file (keys %ts_cache) {
+    delete $ts_cache{$file} unless -e $file;
+}
+my $ts_cache_tmp = "$ts_cache_file.$$.tmp";
+if (open my $fh, '>', $ts_cache_tmp) {
+    print $fh $JSON_CLASS->new->utf8->canonical->encode(\%ts_cache);
+    close $fh;
+    rename($ts_cache_tmp, $ts_cache_file) or warn "Cannot write $ts_cache_file: $!";
+} else {
+    warn "Cannot write $ts_cache_tmp: $!";
+}
@@ -62,14 +62,16 @@ sub doQt($$$$$)
 
   my %scores = ();
   my %langs = ();
+  my @group_res = map { [$_, qr/^${_}_((?:.._)?..)$/] } @{$groups};
 
   my $files = join("\n", <$subdir$infix/translations/*_??.ts>);
   my $res = `$xmlpat -param files=\"$files\" check-ts.xq`;
   for my $i (split(/[ \n]/, $res)) {
     $i =~ /^(?:[^\/]+\/)*([^.]+)\.ts:(.*)$/;
     my ($fn, $pc) = ($1, $2);
-    for my $g (@{$groups}) {
-      if ($fn =~ /^${g}_((.._)?..)$/) {
+    for my $gr (@group_res) {
+      my ($g, $re) = @{$gr};
+      if ($fn =~ $re) {
         my $lang = $1;
         $scores{$g}{$lang} = $pc;
         $langs{$lang} = 1;
@@ -122,11 +124,12 @@ sub doOther()
   my ($dirname, $filename, $appname, $subdir, $version, $state) = @_;
 
   my %scores = ();
+  my $entry_re = qr/^(?:[^\/]+\/)*${filename}_(.*)\.ts:(.*)$/;
 
   my $files = join("\n", <$subdir/$dirname/${filename}*_??.ts>);
   my $res = `$xmlpat -param files=\"$files\" check-ts.xq`;
   for my $i (split(/ /, $res)) {
-    $i =~ /^(?:[^\/]+\/)*${filename}_(.*)\.ts:(.*)$/;
+    $i =~ $entry_re;
     my ($lang, $pc) = ($1, $2);
     $scores{$lang} = $pc;
   }
@@ -48,14 +48,11 @@ upload() {
 for p in *-current; do (
   cd $p || exit
   #git fetch -p -q
-  if test ${p#qt-} != $p; then
+  if test ${p#qt-} != $p && $redo; then
+    # fetch the submodules concurrently, a few at a time
     for i in qt*; do
-      if test -d $i/.git; then (
-        cd $i
-        $redo || exit
-        git fetch -p -q
-      ); fi
-    done
+      test -d $i/.git && echo $i
+    done | xargs -r -P 4 -I{} git -C {} fetch -p -q
   fi
 ); done
 
@@ -111,12 +108,11 @@ EOF
     rm -f *_en.ts
 
     # import qt4 translations
-    for i in qt_??.ts qt_??_??.ts; do
-      if test $(stat -c "%s" $i) -gt 1000; then
-        lng=${i##qt_}
-        lng=${lng%%.ts}
-        PATH=$qt_build/bin:$PATH LD_LIBRARY_PATH=$qt_build/lib $root/split-qt-ts-prebuilt.pl $lng $ver >> $log-$dir.log 2>&1
-      fi
+    # (one find for the size check instead of a stat fork per file)
+    for i in `find . -maxdepth 1 \( -name 'qt_??.ts' -o -name 'qt_??_??.ts' \) -size +1000c -printf '%f\n'`; do
+      lng=${i##qt_}
+      lng=${lng%%.ts}
+      PATH=$qt_build/bin:$PATH LD_LIBRARY_PATH=$qt_build/lib $root/split-qt-ts-prebuilt.pl $lng $ver >> $log-$dir.log 2>&1
     done
 
     upload
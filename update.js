@@ -17,12 +17,20 @@ function fetch(url) {
   });
 }
 
+// Write through a temp file and rename it into place, so the page is never
+// served half-written while update.js runs
+function writeFileAtomic(file, contents) {
+  const tmp = file + '.tmp';
+  fs.writeFileSync(tmp, contents);
+  fs.renameSync(tmp, file);
+}
+
 async function main() {
   console.log('Fetching from https://l10n-files.qt.io/l10n-files/ ...');
   const html = await fetch('https://l10n-files.qt.io/l10n-files/');
   
   // Write raw HTML for debugging
-  fs.writeFileSync(path.join(__dirname, 'raw.html'), html);
+  writeFileAtomic(path.join(__dirname, 'raw.html'), html);
   console.log(`Got ${html.length} bytes, saved to raw.html`);
   
   // Write a data.json that can be loaded as fallback
@@ -48,7 +56,7 @@ try {
   // Inject before </body>
   indexHtml = indexHtml.replace('</body>', dataScript + '\n</body>');
   
-  fs.writeFileSync(indexPath, indexHtml);
+  writeFileAtomic(indexPath, indexHtml);
   console.log('Injected cached data into index.html');
   console.log('Open index.html in your browser - it will use live data if possible, cached data otherwise.');
 }